@@ -4,13 +4,18 @@ from .models import (
     FlightAccessibility,
     HotelAccessibility,
     AccessibilityRequest,
+    FLIGHT_ADAPTER,
+    HOTEL_ADAPTER,
+    REQUEST_ADAPTER,
 )
 
 from .helpers import (
     extract_hotel_accessibility,
     extract_amadeus_hotel_accessibility,
+    extract_amadeus_hotel_accessibility_batch,
     extract_flight_accessibility_from_amadeus,
     validate_ssr_codes,
+    validate_ssr_codes_many,
     get_ssr_code_description,
 )
 
@@ -19,9 +24,14 @@ __all__ = [
     "FlightAccessibility",
     "HotelAccessibility",
     "AccessibilityRequest",
+    "FLIGHT_ADAPTER",
+    "HOTEL_ADAPTER",
+    "REQUEST_ADAPTER",
     "extract_hotel_accessibility",
     "extract_amadeus_hotel_accessibility",
+    "extract_amadeus_hotel_accessibility_batch",
     "extract_flight_accessibility_from_amadeus",
     "validate_ssr_codes",
+    "validate_ssr_codes_many",
     "get_ssr_code_description",
 ]
@@ -1,13 +1,59 @@
 """Helper functions for accessibility data extraction and validation."""
 
-from typing import Any, Dict, List, Optional
+import re
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Final, Optional
+
+_ACCESSIBILITY_KEYWORDS: Final[tuple[str, ...]] = (
+    "wheelchair",
+    "accessible",
+    "mobility",
+    "elevator",
+    "ramp",
+    "parking",
+    "bathroom",
+)
+
+# Precompiled alternation of accessibility-related keywords; a single
+# case-insensitive scan per facility string replaces the per-keyword loop.
+_ACCESSIBILITY_RE = re.compile("|".join(_ACCESSIBILITY_KEYWORDS), re.IGNORECASE)
+
+try:  # Optional: multi-pattern automaton, O(n) regardless of keyword count
+    import ahocorasick  # type: ignore[import-untyped, import-not-found]
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _ACCESSIBILITY_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _ACCESSIBILITY_KEYWORDS:
+        _ACCESSIBILITY_AUTOMATON.add_word(_keyword, _keyword)
+    _ACCESSIBILITY_AUTOMATON.make_automaton()
+else:
+    _ACCESSIBILITY_AUTOMATON = None
+
+
+def _scan_automaton(text: str) -> bool:
+    """Check text for accessibility keywords via the Aho-Corasick automaton."""
+    return next(_ACCESSIBILITY_AUTOMATON.iter(text.lower()), None) is not None
+
+
+def _scan_regex(text: str) -> bool:
+    """Check text for accessibility keywords via the precompiled regex."""
+    return _ACCESSIBILITY_RE.search(text) is not None
+
+
+_has_accessibility_keyword: Callable[[str], bool] = (
+    _scan_automaton if ahocorasick is not None else _scan_regex
+)
 
 
 # =====================================================================
 # IATA SSR CODE REFERENCE
 # =====================================================================
 
-SSR_CODE_DESCRIPTIONS = {
+SSR_CODE_DESCRIPTIONS: Final[dict[str, str]] = {
     "WCHR": "Wheelchair assistance (passenger provides own wheelchair)",
     "WCHS": "Wheelchair with stowage (wheelchair stowed in cargo hold)",
     "STCR": "Stretcher case (medical requirement for stretcher accommodation)",
@@ -16,15 +62,27 @@ SSR_CODE_DESCRIPTIONS = {
     "PRMK": "Passenger with mobility disability (priority seating, extra assistance)",
 }
 
-VALID_SSR_CODES = set(SSR_CODE_DESCRIPTIONS.keys())
+VALID_SSR_CODES: Final[frozenset[str]] = frozenset(SSR_CODE_DESCRIPTIONS)
+
+# Shared read-only view so get_all_ssr_codes never copies the dict.
+_SSR_CODE_DESCRIPTIONS_VIEW: Final[Mapping[str, str]] = MappingProxyType(
+    SSR_CODE_DESCRIPTIONS
+)
+
+# Precomputed once at import; the valid-code listing never changes at runtime.
+_VALID_SSR_CODES_MSG: Final[str] = ", ".join(sorted(VALID_SSR_CODES))
 
 
 # =====================================================================
 # HOTEL ACCESSIBILITY EXTRACTION
 # =====================================================================
 
+# SerpAPI amenity IDs that indicate accessibility; currently just
+# wheelchair accessible (53), but kept as a set so new IDs are O(1) to test.
+_ACCESSIBLE_AMENITY_IDS: Final[frozenset[int]] = frozenset({53})
+
 
-def extract_hotel_accessibility(hotel_property: Dict[str, Any]) -> Dict[str, Any]:
+def extract_hotel_accessibility(hotel_property: dict[str, Any]) -> dict[str, Any]:
     """Extract accessibility information from SerpAPI hotel property.
 
     SerpAPI includes amenities with IDs. Amenity ID 53 = wheelchair accessible.
@@ -36,9 +94,8 @@ def extract_hotel_accessibility(hotel_property: Dict[str, Any]) -> Dict[str, Any
         Dictionary with accessibility information
     """
     amenities = hotel_property.get("amenities", [])
-    amenity_ids = [a.get("id") for a in amenities if isinstance(a, dict) and "id" in a]
-
-    wheelchair_accessible = 53 in amenity_ids
+    amenity_ids = {a["id"] for a in amenities if isinstance(a, dict) and "id" in a}
+    wheelchair_accessible = bool(amenity_ids & _ACCESSIBLE_AMENITY_IDS)
 
     return {
         "wheelchair_accessible": wheelchair_accessible,
@@ -48,7 +105,7 @@ def extract_hotel_accessibility(hotel_property: Dict[str, Any]) -> Dict[str, Any
     }
 
 
-def extract_amadeus_hotel_accessibility(hotel_data: Dict[str, Any]) -> Dict[str, Any]:
+def extract_amadeus_hotel_accessibility(hotel_data: dict[str, Any]) -> dict[str, Any]:
     """Extract accessibility information from Amadeus hotel offer.
 
     Amadeus returns facility and description data that may contain accessibility info.
@@ -59,82 +116,91 @@ def extract_amadeus_hotel_accessibility(hotel_data: Dict[str, Any]) -> Dict[str,
     Returns:
         Dictionary with accessibility information
     """
-    facilities = hotel_data.get("facilities", [])
-    hotel_data.get("descriptions", {})
-
-    # Build facility list from facilities array
-    facility_list = []
-    if facilities:
-        for facility in facilities:
-            if isinstance(facility, dict):
-                facility_list.append(facility.get("description", str(facility)))
-            else:
-                facility_list.append(str(facility))
-
-    # Check for accessibility-related facilities
-    accessibility_keywords = [
-        "wheelchair",
-        "accessible",
-        "mobility",
-        "elevator",
-        "ramp",
-        "parking",
-        "bathroom",
-    ]
-
-    has_accessibility = any(
-        keyword.lower() in str(facility).lower()
-        for facility in facility_list
-        for keyword in accessibility_keywords
-    )
+    return extract_amadeus_hotel_accessibility_batch([hotel_data])[0]
 
-    return {
-        "wheelchair_accessible": has_accessibility,
-        "accessible_room_available": has_accessibility,
-        "facility_list": facility_list,
-    }
-
-
-# =====================================================================
-# FLIGHT ACCESSIBILITY EXTRACTION
-# =====================================================================
 
+def extract_amadeus_hotel_accessibility_batch(
+    hotels: list[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    """Extract accessibility information from a batch of Amadeus hotel offers.
 
-def extract_flight_accessibility_from_amadeus(
-    flight_offer: Dict[str, Any],
-) -> Dict[str, Any]:
-    """Extract accessibility information from Amadeus flight offer.
-
-    Amadeus returns traveler pricing which may include special service requests (SSR).
+    Processes a full search result page in one sweep, running a single
+    fused keyword scan per hotel instead of per facility.
 
     Args:
-        flight_offer: Flight offer dict from Amadeus API response
+        hotels: Hotel data dicts from Amadeus API responses
 
     Returns:
-        Dictionary with accessibility information and SSR codes
+        List of accessibility dictionaries, one per input hotel
     """
-    ssr_codes = []
-
-    # Extract SSR codes from traveler pricing if available
-    traveler_pricings = flight_offer.get("travelerPricings", [])
-    for pricing in traveler_pricings:
-        fare_details = pricing.get("fareDetailsBySegment", [])
-        for detail in fare_details:
-            detail.get("includedCheckedBags", {})
-            # SSR codes are not typically in the response, but could be passed by user
-            # This is a placeholder for extracting them if available in extended response
-            pass
+    results = []
+    for hotel_data in hotels:
+        facilities = hotel_data.get("facilities", [])
+
+        # Build facility list in a single comprehension. Dicts without a
+        # description contribute an empty string rather than their repr,
+        # which would otherwise leak keyword-like text into the scan.
+        facility_list = [
+            (f.get("description") or "") if isinstance(f, dict) else str(f)
+            for f in facilities
+        ]
+
+        # Fuse the facility strings into one buffer so the keyword scan runs
+        # once per hotel instead of once per facility. The newline separator
+        # cannot appear inside a keyword, so no false positives across entries.
+        joined = "\n".join(f for f in facility_list if isinstance(f, str))
+        has_accessibility = bool(joined) and _has_accessibility_keyword(joined)
+
+        results.append(
+            {
+                "wheelchair_accessible": has_accessibility,
+                "accessible_room_available": has_accessibility,
+                "facility_list": facility_list,
+            }
+        )
 
-    return {
+    return results
+
+
+# =====================================================================
+# FLIGHT ACCESSIBILITY EXTRACTION
+# =====================================================================
+
+
+# Amadeus flight offers do not carry SSR data, so extraction always yields
+# these defaults; shared as a read-only view to avoid a dict allocation
+# per offer.
+_DEFAULT_FLIGHT_ACCESSIBILITY: Final[Mapping[str, Any]] = MappingProxyType(
+    {
         "wheelchair_available": False,
         "wheelchair_stowage": False,
         "accessible_lavatory": False,
         "extra_legroom_available": False,
-        "special_service_codes": ssr_codes if ssr_codes else None,
+        "special_service_codes": None,
         "companion_required": None,
         "special_meals_available": False,
         "notes": "Check with airline for specific accessibility accommodations",
     }
+)
+
+
+def extract_flight_accessibility_from_amadeus(
+    flight_offer: dict[str, Any],
+) -> Mapping[str, Any]:
+    """Extract accessibility information from Amadeus flight offer.
+
+    Amadeus flight offers do not include special service request (SSR) data,
+    so this returns the default accessibility information for every offer.
+
+    Args:
+        flight_offer: Flight offer dict from Amadeus API response
+
+    Returns:
+        Read-only mapping with accessibility information and SSR codes.
+        Callers that need a mutable copy should wrap the result in
+        ``dict(...)``.
+    """
+    return _DEFAULT_FLIGHT_ACCESSIBILITY
 
 
 # =====================================================================
@@ -142,11 +208,16 @@ def extract_flight_accessibility_from_amadeus(
 # =====================================================================
 
 
-def validate_ssr_codes(codes: Optional[List[str]]) -> Optional[List[str]]:
+def validate_ssr_codes(codes: Any) -> Optional[list[str]]:
     """Validate IATA Special Service Request (SSR) codes.
 
+    The parameter is deliberately typed ``Any``: malformed input must
+    reach the ValueError-raising checks below even when this module is
+    compiled with mypyc, which otherwise rejects it at the native
+    argument boundary with TypeError.
+
     Args:
-        codes: List of SSR codes to validate
+        codes: List of SSR codes to validate, or None
 
     Returns:
         List of valid codes, or None if input is None
@@ -154,28 +225,70 @@ def validate_ssr_codes(codes: Optional[List[str]]) -> Optional[List[str]]:
     Raises:
         ValueError: If any code is invalid
     """
-    if codes is None:
-        return None
+    return validate_ssr_codes_many([codes])[0]
 
-    if not isinstance(codes, list):
-        raise ValueError(f"SSR codes must be a list, got {type(codes)}")
 
-    validated = []
-    for code in codes:
-        if not isinstance(code, str):
-            raise ValueError(f"SSR code must be string, got {type(code)}")
+def validate_ssr_codes_many(
+    code_lists: Iterable[Any],
+) -> list[Optional[list[str]]]:
+    """Validate SSR code lists for several passengers in one sweep.
+
+    Concatenates all codes, validates the concatenation once, and
+    re-partitions the results, amortizing per-call overhead across a
+    multi-passenger booking. Entries are typed ``Any`` so malformed
+    input still reaches the ValueError-raising checks under mypyc
+    compilation (see validate_ssr_codes).
+
+    Args:
+        code_lists: One optional list of SSR codes per passenger
 
-        code_upper = code.upper()
-        if code_upper not in VALID_SSR_CODES:
-            raise ValueError(
-                f"Invalid SSR code '{code}'. Valid codes: {', '.join(sorted(VALID_SSR_CODES))}"
-            )
+    Returns:
+        List of validated code lists, with None entries passed through
+
+    Raises:
+        ValueError: If any entry is neither a list nor None, or any code
+            is invalid
+    """
+    # list[Any], not list[str]: under mypyc a typed list would raise
+    # TypeError on non-string codes before .upper() can raise the
+    # AttributeError that is converted to ValueError below.
+    flat: list[Any] = []
+    lengths: list[Optional[int]] = []
+    for codes in code_lists:
+        if codes is None:
+            lengths.append(None)
+            continue
+
+        if not isinstance(codes, list):
+            raise ValueError(f"SSR codes must be a list, got {type(codes)}")
+
+        lengths.append(len(codes))
+        flat.extend(codes)
+
+    try:
+        validated = [code.upper() for code in flat]
+    except AttributeError:
+        raise ValueError("SSR codes must be strings") from None
+
+    invalid = set(validated) - VALID_SSR_CODES
+    if invalid:
+        raise ValueError(
+            f"Invalid SSR code(s) {sorted(invalid)}. Valid codes: {_VALID_SSR_CODES_MSG}"
+        )
 
-        validated.append(code_upper)
+    results: list[Optional[list[str]]] = []
+    position = 0
+    for length in lengths:
+        if length is None:
+            results.append(None)
+        else:
+            results.append(validated[position : position + length])
+            position += length
 
-    return validated
+    return results
 
 
+@lru_cache(maxsize=32)
 def get_ssr_code_description(code: str) -> str:
     """Get human-readable description of an IATA SSR code.
 
@@ -191,16 +304,17 @@ def get_ssr_code_description(code: str) -> str:
     code_upper = code.upper()
     if code_upper not in VALID_SSR_CODES:
         raise ValueError(
-            f"Invalid SSR code '{code}'. Valid codes: {', '.join(sorted(VALID_SSR_CODES))}"
+            f"Invalid SSR code '{code}'. Valid codes: {_VALID_SSR_CODES_MSG}"
         )
 
     return SSR_CODE_DESCRIPTIONS[code_upper]
 
 
-def get_all_ssr_codes() -> Dict[str, str]:
+def get_all_ssr_codes() -> Mapping[str, str]:
     """Get all valid IATA SSR codes and their descriptions.
 
     Returns:
-        Dictionary mapping code to description
+        Read-only mapping of code to description. Callers that need a
+        mutable copy should wrap the result in ``dict(...)``.
     """
-    return SSR_CODE_DESCRIPTIONS.copy()
+    return _SSR_CODE_DESCRIPTIONS_VIEW
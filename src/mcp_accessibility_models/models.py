@@ -1,12 +1,20 @@
 """Pydantic models for accessibility features across MCP travel services."""
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+# Models are read-only value objects built once per search result; freezing
+# them and skipping default re-validation keeps per-instance construction
+# cheap on large result pages.
+_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, validate_default=False)
 
 
 class FlightAccessibility(BaseModel):
     """Accessibility features and accommodations for flights."""
 
+    model_config = _MODEL_CONFIG
+
     wheelchair_available: bool = Field(
         False,
         description="Wheelchair seating/accommodation available",
@@ -41,8 +49,19 @@ class FlightAccessibility(BaseModel):
     )
 
 
-class HotelAccessibility(BaseModel):
-    """Accessibility features and accommodations for hotels."""
+@pydantic_dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(extra="ignore", validate_default=False),
+)
+class HotelAccessibility:
+    """Accessibility features and accommodations for hotels.
+
+    Hotel searches materialize one instance per property, so this is a
+    slotted dataclass rather than a BaseModel to avoid the per-instance
+    ``__dict__``. Use ``TypeAdapter(HotelAccessibility)`` for schema
+    generation and dict validation.
+    """
 
     wheelchair_accessible: bool = Field(
         False,
@@ -89,6 +108,8 @@ class HotelAccessibility(BaseModel):
 class AccessibilityRequest(BaseModel):
     """Accessibility requirements for personalized trip planning."""
 
+    model_config = _MODEL_CONFIG
+
     wheelchair_user: bool = Field(
         False,
         description="Traveler uses wheelchair (may require stowage)",
@@ -117,3 +138,11 @@ class AccessibilityRequest(BaseModel):
         None,
         description="Additional mobility or medical needs (allergies, equipment, etc.)",
     )
+
+
+# Adapters compiled once at import for bulk dict-to-model conversion;
+# prefer e.g. FLIGHT_ADAPTER.validate_python(payload) over
+# FlightAccessibility(**payload) when ingesting helper output in loops.
+FLIGHT_ADAPTER: TypeAdapter[FlightAccessibility] = TypeAdapter(FlightAccessibility)
+HOTEL_ADAPTER: TypeAdapter[HotelAccessibility] = TypeAdapter(HotelAccessibility)
+REQUEST_ADAPTER: TypeAdapter[AccessibilityRequest] = TypeAdapter(AccessibilityRequest)
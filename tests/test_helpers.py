@@ -4,8 +4,10 @@ import pytest
 from mcp_accessibility_models import (
     extract_hotel_accessibility,
     extract_amadeus_hotel_accessibility,
+    extract_amadeus_hotel_accessibility_batch,
     extract_flight_accessibility_from_amadeus,
     validate_ssr_codes,
+    validate_ssr_codes_many,
     get_ssr_code_description,
 )
 
@@ -128,6 +130,36 @@ class TestAmadeusHotelAccessibilityExtraction:
         assert accessibility["wheelchair_accessible"] is True
 
 
+class TestAmadeusHotelAccessibilityBatch:
+    """Test batch extraction of accessibility data from Amadeus hotels."""
+
+    def test_batch_mixed_hotels(self):
+        """Test batch extraction over accessible and non-accessible hotels."""
+        hotels = [
+            {"facilities": [{"description": "Wheelchair accessible rooms"}]},
+            {"facilities": [{"description": "Restaurant"}]},
+            {"name": "No Facilities Hotel"},
+        ]
+        results = extract_amadeus_hotel_accessibility_batch(hotels)
+        assert len(results) == 3
+        assert results[0]["wheelchair_accessible"] is True
+        assert results[1]["wheelchair_accessible"] is False
+        assert results[2]["facility_list"] == []
+
+    def test_batch_empty(self):
+        """Test batch extraction with no hotels."""
+        assert extract_amadeus_hotel_accessibility_batch([]) == []
+
+    def test_batch_matches_scalar(self):
+        """Test that batch results match per-hotel extraction."""
+        hotels = [
+            {"facilities": [{"description": "Elevator"}, {"description": "WiFi"}]},
+            {"facilities": [{"description": "Pool"}]},
+        ]
+        batched = extract_amadeus_hotel_accessibility_batch(hotels)
+        assert batched == [extract_amadeus_hotel_accessibility(h) for h in hotels]
+
+
 class TestFlightAccessibilityExtraction:
     """Test extraction of accessibility data from flight offers."""
 
@@ -195,6 +227,24 @@ class TestSSRCodeValidation:
             validate_ssr_codes([123])
 
 
+class TestSSRCodeValidationMany:
+    """Test batched IATA SSR code validation."""
+
+    def test_validate_many_mixed(self):
+        """Test validation across several passengers, including None."""
+        validated = validate_ssr_codes_many([["wchr"], None, ["DEAF", "blnd"]])
+        assert validated == [["WCHR"], None, ["DEAF", "BLND"]]
+
+    def test_validate_many_empty(self):
+        """Test that an empty batch returns an empty list."""
+        assert validate_ssr_codes_many([]) == []
+
+    def test_validate_many_invalid_code_raises_error(self):
+        """Test that an invalid code in any passenger list raises ValueError."""
+        with pytest.raises(ValueError):
+            validate_ssr_codes_many([["WCHR"], ["INVALID"]])
+
+
 class TestSSRCodeDescription:
     """Test IATA SSR code descriptions."""
 
@@ -1,5 +1,7 @@
 """Tests for accessibility Pydantic models."""
 
+from pydantic import TypeAdapter
+
 from mcp_accessibility_models import (
     FlightAccessibility,
     HotelAccessibility,
@@ -155,7 +157,7 @@ class TestHotelAccessibility:
 
     def test_hotel_accessibility_schema(self):
         """Test that HotelAccessibility has proper field descriptions."""
-        schema = HotelAccessibility.model_json_schema()
+        schema = TypeAdapter(HotelAccessibility).json_schema()
         assert "properties" in schema
         assert "wheelchair_accessible" in schema["properties"]
         assert "accessible_parking" in schema["properties"]